@@ -48,6 +48,7 @@ with col1:
 
     st.page_link("pages/1_Walkability Index.py", label="Scenario-Based Walkability Scores | Explore How Walkable Münster is!")
     st.page_link("pages/2_Sub-Indexes.py", label="Walkability Scores and Sub-Indexes")
+    st.page_link("pages/3_Scenario Deltas.py", label="Scenario Deltas | Which Streets Change Most from Heat to Precipitation?")
 
 with col2:
     st.markdown("<h4>How Walkable is Münster by Districts?</h4>", unsafe_allow_html=True)
@@ -0,0 +1,69 @@
+import numpy as np
+import pandas as pd
+
+# SCENARIO COLUMNS ---------------------------
+# Score columns that exist for both scenarios (Scenario-I: August, Scenario-II: October)
+scenario_columns = {
+    "Walkability Score": ("Walkability Score - August", "Walkability Score - October"),
+    "Outdoor Thermal Comfort": ("Outdoor Thermal Comfort - August", "Outdoor Thermal Comfort - October"),
+}
+
+
+# SCENARIO DELTAS ---------------------------
+def compute_deltas(streets_df):
+    # October minus August for every score column in one vectorized pass,
+    # negative values mean the street segment degrades under precipitation
+    august_columns = [august for august, _ in scenario_columns.values()]
+    october_columns = [october for _, october in scenario_columns.values()]
+
+    august = streets_df[august_columns].to_numpy(dtype=float)
+    october = streets_df[october_columns].to_numpy(dtype=float)
+
+    deltas = pd.DataFrame(october - august, columns=list(scenario_columns), index=streets_df.index)
+    deltas.insert(0, "Unique_ID", streets_df["Unique_ID"].astype(str).to_numpy())
+    deltas.insert(1, "District", streets_df["District"].to_numpy())
+    return deltas
+
+
+def filter_district(deltas, district=None):
+    # None means city-wide
+    if district is None:
+        return deltas
+    return deltas[deltas["District"] == district]
+
+
+# TOP-K RANKING ---------------------------
+def top_k(deltas, column, k=10, worst=True):
+    # argpartition selects the k extreme rows in linear time, only those k are sorted
+    deltas = deltas[deltas[column].notna()]
+    values = deltas[column].to_numpy(dtype=float)
+    if not worst:
+        values = -values
+
+    k = min(k, len(values))
+    if k == 0:
+        return deltas.iloc[[]]
+
+    if k < len(values):
+        candidates = np.argpartition(values, k - 1)[:k]
+    else:
+        candidates = np.arange(len(values))
+    order = candidates[np.argsort(values[candidates], kind="stable")]
+
+    return deltas.iloc[order]
+
+
+# HISTOGRAMS ---------------------------
+def delta_histogram(deltas, column, bins=30):
+    # Counts and bin edges of the deltas of one score column,
+    # 0 is always an edge so no bin mixes declines and improvements
+    values = deltas[column].dropna().to_numpy(dtype=float)
+    if len(values) == 0:
+        return np.histogram(values, bins=bins)
+
+    low, high = min(values.min(), 0.0), max(values.max(), 0.0)
+    width = (high - low) / bins if high > low else 1.0
+    first = np.floor(low / width)
+    count = max(int(np.ceil(high / width - first)), 1)
+    edges = (first + np.arange(count + 1)) * width
+    return np.histogram(values, bins=edges)
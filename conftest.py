@@ -0,0 +1 @@
+# Lets the tests import the top-level modules (analytics.py) with a plain `pytest`
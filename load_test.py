@@ -0,0 +1,316 @@
+import argparse
+import asyncio
+import os
+import random
+import socket
+import subprocess
+import sys
+import time
+import urllib.request
+
+import numpy as np
+import pandas as pd
+import geopandas as gpd
+import websockets
+from streamlit.proto.BackMsg_pb2 import BackMsg
+from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+from streamlit.proto.WidgetStates_pb2 import WidgetState
+
+# Load harness for the Streamlit pages.
+# It starts one `streamlit run Home.py` server and connects N concurrent sessions
+# to it over the same websocket protocol the browser uses, so all sessions compete
+# for the server's threads, st.cache_* stores, GIL and memory like real users do.
+# Every session opens each page and replays a random sequence of widget changes,
+# timing every rerun from the request until the server reports the script finished.
+#
+# Usage: python load_test.py --sessions 8 --steps 20
+
+# PAGES AND WIDGETS -------------------------------------
+# Page name as in the URL, "" is Home.py
+PAGES = {
+    "Home": "",
+    "Walkability Index": "Walkability_Index",
+    "Sub-Indexes": "Sub-Indexes",
+    "Scenario Deltas": "Scenario_Deltas",
+}
+
+# Widget changes replayed per page: (action, widget label)
+ACTIONS = {
+    "Home": [
+        ("district", "Select a district to explore its walkability based on the data from Stadt-Münster"),
+    ],
+    "Walkability Index": [
+        ("district", "Select a District"),
+        ("scenario", "Select a Scenario"),
+        ("theme", "Select a Color Theme"),
+        ("street_id", "Enter Street ID (Unique_ID):"),
+    ],
+    "Sub-Indexes": [
+        ("district", "Select a District"),
+        ("sub_index", "Select a Sub-Index"),
+        ("theme", "Select a Color Theme"),
+    ],
+    "Scenario Deltas": [
+        ("district", "Select a District"),
+        ("score", "Select a Score"),
+        ("k", "Number of Streets (Top-K)"),
+    ],
+}
+
+
+def load_street_ids():
+    # Street IDs typed into the text input, the select box options come from the server
+    streets_df = gpd.read_file('Data/ms_streets_prj.geojson', ignore_geometry=True)
+    return list(streets_df['Unique_ID'].astype(str).unique())
+
+
+def widget_state(kind, widget, rng, street_ids):
+    # Random new value for a widget, serialized the way the browser sends it
+    state = WidgetState(id=widget.id)
+    if kind == "selectbox":
+        state.string_value = rng.choice(list(widget.options))
+    elif kind == "slider":
+        state.double_array_value.data[:] = [rng.choice(np.arange(widget.min, widget.max + widget.step, widget.step))]
+    else:
+        state.string_value = rng.choice(street_ids)
+    return state
+
+
+# SERVER -------------------------------------
+def start_server(port):
+    server = subprocess.Popen(
+        [sys.executable, "-m", "streamlit", "run", "Home.py",
+         "--server.headless", "true",
+         "--server.port", str(port),
+         "--server.fileWatcherType", "none",
+         "--browser.gatherUsageStats", "false"],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+
+    # Wait until the server answers its health check
+    for _ in range(120):
+        try:
+            with urllib.request.urlopen(f"http://localhost:{port}/_stcore/health") as response:
+                if response.read() == b"ok":
+                    return server
+        except OSError:
+            time.sleep(0.5)
+    server.terminate()
+    raise RuntimeError("Streamlit server did not start")
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(("localhost", 0))
+        return sock.getsockname()[1]
+
+
+def memory_reader(pid):
+    # Function returning the current RSS of the server process, None if it can't be read here
+    statm_path = f"/proc/{pid}/statm"
+    if os.path.exists(statm_path):
+        def read_rss():
+            with open(statm_path) as statm:
+                resident_pages = int(statm.read().split()[1])
+            return resident_pages * os.sysconf("SC_PAGE_SIZE") / 1024 ** 2
+        return read_rss
+
+    # No procfs (e.g. macOS)
+    try:
+        import psutil
+    except ImportError:
+        print("Warning: no /proc and psutil is not installed, server memory is not reported", file=sys.stderr)
+        return None
+    process = psutil.Process(pid)
+    return lambda: process.memory_info().rss / 1024 ** 2
+
+
+# SESSION -------------------------------------
+async def rerun(ws, page_name, widget_states, timeout):
+    # Ask the server for a rerun and read its messages until the script finished
+    message = BackMsg()
+    message.rerun_script.page_name = page_name
+    message.rerun_script.widget_states.widgets.extend(widget_states)
+
+    widgets = {}
+    exceptions = 0
+
+    async def read_until_finished():
+        nonlocal exceptions
+        while True:
+            forward = ForwardMsg()
+            forward.ParseFromString(await ws.recv())
+            kind = forward.WhichOneof("type")
+
+            if kind == "delta" and forward.delta.WhichOneof("type") == "new_element":
+                element = forward.delta.new_element
+                element_type = element.WhichOneof("type")
+                if element_type in ("selectbox", "slider", "text_input"):
+                    widget = getattr(element, element_type)
+                    widgets[widget.label] = (element_type, widget)
+                elif element_type == "exception":
+                    exceptions += 1
+            elif kind == "script_finished":
+                return
+
+    start = time.perf_counter()
+    await ws.send(message.SerializeToString())
+    await asyncio.wait_for(read_until_finished(), timeout)
+    seconds = time.perf_counter() - start
+
+    return seconds, "exception" if exceptions else "ok", widgets
+
+
+def record_failure(samples, page, label, status, error):
+    # Failures only count, they have no latency, the reason goes to stderr
+    samples.append((page, label, None, status))
+    print(f"[{page} / {label}] {status}: {type(error).__name__}: {error}", file=sys.stderr)
+
+
+async def run_session(session_id, url, street_ids, steps, timeout, seed, progress):
+    rng = random.Random(seed + session_id)
+    samples = []
+
+    for page, page_name in PAGES.items():
+        label = "initial"
+        # A new connection per page, a failed page does not take the next ones down
+        try:
+            async with websockets.connect(url, max_size=None) as ws:
+                seconds, status, widgets = await rerun(ws, page_name, [], timeout)
+                samples.append((page, label, seconds, status))
+                progress["reruns"] += 1
+
+                widget_states = {}
+                for _ in range(steps):
+                    label, widget_label = rng.choice(ACTIONS[page])
+                    kind, widget = widgets[widget_label]
+                    widget_states[widget_label] = widget_state(kind, widget, rng, street_ids)
+
+                    # Send the states of the widgets shown in the last run, like the browser does
+                    current = [state for name, state in widget_states.items() if name in widgets]
+                    seconds, status, widgets = await rerun(ws, page_name, current, timeout)
+                    samples.append((page, label, seconds, status))
+                    progress["reruns"] += 1
+        except asyncio.TimeoutError as error:
+            # The rest of this page is skipped
+            record_failure(samples, page, label, "timeout", error)
+        except Exception as error:
+            record_failure(samples, page, label, "error", error)
+
+    return {"session": session_id, "samples": samples}
+
+
+async def sample_memory(read_rss, progress, timeline, interval=0.2):
+    # Server RSS over the number of runs finished so far, independent of the sessions
+    while True:
+        timeline.append((progress["reruns"], read_rss()))
+        await asyncio.sleep(interval)
+
+
+async def run_sessions(url, street_ids, sessions, steps, timeout, seed, read_rss):
+    progress = {"reruns": 0}
+
+    # One warm-up pass over all pages fills the caches, its samples are not reported
+    await run_session(sessions, url, street_ids, 1, timeout, seed, progress)
+    progress["reruns"] = 0
+
+    timeline = []
+    sampler = asyncio.create_task(sample_memory(read_rss, progress, timeline)) if read_rss else None
+
+    start = time.perf_counter()
+    results = await asyncio.gather(*[
+        run_session(session_id, url, street_ids, steps, timeout, seed, progress)
+        for session_id in range(sessions)
+    ])
+    wall_time = time.perf_counter() - start
+
+    if sampler is not None:
+        sampler.cancel()
+        timeline.append((progress["reruns"], read_rss()))
+
+    return results, wall_time, timeline
+
+
+# REPORT -------------------------------------
+def percentiles(group):
+    # Latencies of completed runs only, errors and timeouts are counted
+    values = group.loc[group["Status"].isin(["ok", "exception"]), "Latency (ms)"].to_numpy(dtype=float)
+    if len(values) == 0:
+        values = np.array([np.nan])
+    return pd.Series({
+        "Completed": (group["Status"].isin(["ok", "exception"])).sum(),
+        "p50": np.percentile(values, 50),
+        "p95": np.percentile(values, 95),
+        "p99": np.percentile(values, 99),
+        "Max": values.max(),
+        "Exceptions": (group["Status"] == "exception").sum(),
+        "Errors": (group["Status"] == "error").sum(),
+        "Timeouts": (group["Status"] == "timeout").sum(),
+    })
+
+
+def print_report(results, wall_time, timeline):
+    latencies = pd.DataFrame(
+        [(page, label, seconds * 1000 if seconds is not None else None, status)
+         for result in results for page, label, seconds, status in result["samples"]],
+        columns=["Page", "Action", "Latency (ms)", "Status"],
+    )
+    # Page loads (first run of a page in a session) are reported apart from the reruns
+    loads = latencies[latencies["Action"] == "initial"]
+    reruns = latencies[latencies["Action"] != "initial"]
+    value_columns = ["Latency (ms)", "Status"]
+
+    print("\nPAGE LOADS (ms) ---------------------------")
+    print(loads.groupby("Page")[value_columns].apply(percentiles).round(1).to_string())
+
+    print("\nRERUN LATENCY (ms) ---------------------------")
+    print(reruns.groupby(["Page", "Action"])[value_columns].apply(percentiles).round(1).to_string())
+
+    print("\nOVERALL RERUNS ---------------------------")
+    print(percentiles(reruns).round(1).to_string())
+    completed = reruns["Status"].isin(["ok", "exception"]).sum()
+    print(f"Sessions:   {len(results)}")
+    print(f"Wall time:  {wall_time:.1f} s")
+    print(f"Throughput: {completed / wall_time:.2f} completed reruns/s")
+
+    if timeline:
+        runs, rss = np.array(timeline).T
+        growth = np.polyfit(runs, rss, 1)[0] if len(np.unique(runs)) > 1 else 0.0
+        print("\nSERVER MEMORY (current RSS, after one warm-up pass) ---------------------------")
+        print(f"Baseline:   {rss[0]:.1f} MB")
+        print(f"End:        {rss[-1]:.1f} MB")
+        print(f"Peak:       {rss.max():.1f} MB")
+        print(f"Growth:     {growth * 1024:.1f} KB/run over {int(runs[-1])} runs")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Replay concurrent widget sessions against a Streamlit server.")
+    parser.add_argument("--sessions", type=int, default=4, help="number of concurrent sessions")
+    parser.add_argument("--steps", type=int, default=10, help="widget changes replayed per page and session")
+    parser.add_argument("--timeout", type=float, default=120, help="seconds allowed for a single rerun")
+    parser.add_argument("--seed", type=int, default=0, help="seed for the widget sequences")
+    parser.add_argument("--url", help="websocket of a running server, e.g. ws://localhost:8501/_stcore/stream "
+                                      "(default: start a local server, only then memory is reported)")
+    args = parser.parse_args()
+
+    street_ids = load_street_ids()
+
+    server = None
+    url = args.url
+    if url is None:
+        port = free_port()
+        server = start_server(port)
+        url = f"ws://localhost:{port}/_stcore/stream"
+
+    try:
+        read_rss = memory_reader(server.pid) if server is not None else None
+        results, wall_time, timeline = asyncio.run(run_sessions(
+            url, street_ids, args.sessions, args.steps, args.timeout, args.seed, read_rss,
+        ))
+    finally:
+        if server is not None:
+            server.terminate()
+            server.wait()
+
+    print_report(results, wall_time, timeline)
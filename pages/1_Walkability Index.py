@@ -36,7 +36,10 @@ district_names = districts_gdf['NAME_STADT'].unique()
 col1, col2, col3 = st.columns(3)
 
 with col1:
-    selected_district = st.selectbox("Select a District", district_names)
+    # The Scenario Deltas page may preset this key, ignore districts that have no polygon
+    if st.session_state.get("walkability_district") not in district_names:
+        st.session_state.pop("walkability_district", None)
+    selected_district = st.selectbox("Select a District", district_names, key="walkability_district")
 
 with col2:
     selected_scenario = st.selectbox("Select a Scenario", ["Scenario-I", "Scenario-II"])
@@ -192,7 +195,7 @@ st.markdown(
 streets_gdf['Unique_ID'] = streets_gdf['Unique_ID'].astype(str)
 
 # Search box for Street ID
-selected_street_id = st.text_input("Enter Street ID (Unique_ID):", "")
+selected_street_id = st.text_input("Enter Street ID (Unique_ID):", key="walkability_street_id")
 
 # If a Street ID is entered, proceed with visualization
 if selected_street_id:
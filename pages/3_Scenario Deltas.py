@@ -0,0 +1,176 @@
+import streamlit as st
+import folium
+from streamlit_folium import folium_static
+from folium.plugins import Fullscreen
+import geopandas as gpd
+import plotly.graph_objects as go
+
+from analytics import scenario_columns, compute_deltas, filter_district, top_k, delta_histogram
+
+# LAYOUT -------------------------------------
+st.set_page_config(page_title="Scenario Deltas", page_icon="🚶", initial_sidebar_state="auto", layout="wide")
+st.markdown(
+    "<h1>Walkability Index <b style='color:red;'> <span style='font-size:1.2em;'>| Scenario Deltas</span></b></h1>",
+    unsafe_allow_html=True
+)
+
+# SIDEBAR AND MS LOGO -------------------------------------
+# Create space and push the image to the bottom
+st.sidebar.markdown("<br><br><br><br><br><br><br><br><br><br><br><br><br><br><br><br><br><br><br>", unsafe_allow_html=True)  # Adds spacing
+
+# Add logo at the bottom
+st.sidebar.markdown("<p style='text-align:center; font-size:14px;'>© 2024 Walkability Index | Developed by Şafak Çöze</p>", unsafe_allow_html=True)
+
+# RELATED DATASETS -------------------------------------
+# Load the streets once per server process and share them between sessions,
+# cache_resource hands out the same objects, the page only reads them
+@st.cache_resource
+def load_streets():
+    streets_gdf = gpd.read_file('Data/ms_streets_prj.geojson')
+    streets_gdf['Unique_ID'] = streets_gdf['Unique_ID'].astype(str)
+    return streets_gdf
+
+@st.cache_resource
+def load_deltas():
+    return compute_deltas(load_streets())
+
+@st.cache_data
+def rank_streets(district, column, k, worst):
+    return top_k(filter_district(load_deltas(), district), column, k=k, worst=worst)
+
+@st.cache_data
+def histogram(district, column):
+    return delta_histogram(filter_district(load_deltas(), district), column)
+
+streets_gdf = load_streets()
+deltas = load_deltas()
+
+# Districts of the street segments, "Münster City" ranks all segments
+district_names = ["Münster City"] + sorted(deltas['District'].dropna().unique())
+
+# Place District, Score, and Top-K selection next to each other
+col1, col2, col3 = st.columns(3)
+
+with col1:
+    selected_district = st.selectbox("Select a District", district_names)
+
+with col2:
+    selected_score = st.selectbox("Select a Score", list(scenario_columns))
+
+with col3:
+    k = st.slider("Number of Streets (Top-K)", min_value=5, max_value=50, value=10, step=5)
+
+district = None if selected_district == "Münster City" else selected_district
+
+worst_streets = rank_streets(district, selected_score, k, True)
+best_streets = rank_streets(district, selected_score, k, False)
+
+st.divider()
+
+# TOP-K TABLES -------------------------------------
+col4, col5 = st.columns(2, gap="large")
+
+with col4:
+    st.markdown("<h4>Largest Decline <span style='color:blue;'>| Scenario-II</span> 🌧️</h4>", unsafe_allow_html=True)
+    st.dataframe(worst_streets[['Unique_ID', 'District', selected_score]], hide_index=True, use_container_width=True)
+
+with col5:
+    st.markdown("<h4>Largest Improvement <span style='color:blue;'>| Scenario-II</span> 🌧️</h4>", unsafe_allow_html=True)
+    st.dataframe(best_streets[['Unique_ID', 'District', selected_score]], hide_index=True, use_container_width=True)
+
+with st.expander("See explanation"):
+    st.write('''
+            The delta is the score under Scenario-II (October, precipitation) minus the score
+            under Scenario-I (August, heat). Negative values mean the street segment becomes
+            less walkable under precipitation, positive values mean it becomes more walkable.
+    ''')
+
+st.divider()
+
+# MAP OF TOP-K STREETS -------------------------------------
+top_streets = streets_gdf.loc[worst_streets.index.append(best_streets.index).unique()]
+top_streets = top_streets[top_streets.geometry.notna()]
+
+if not top_streets.empty:
+    minx, miny, maxx, maxy = top_streets.total_bounds
+
+    # Create Folium map with a gray basemap (CartoDB Positron)
+    m = folium.Map(location=[(miny + maxy) / 2, (minx + maxx) / 2], zoom_start=13, tiles='CartoDB positron')
+
+    for index, row in top_streets.iterrows():
+        delta = deltas.at[index, selected_score]
+        color = "#d13728" if delta < 0 else "#436b88"
+
+        popup_text = f"""
+        <b>Street ID:</b> {row['Unique_ID']}<br>
+        <b>District:</b> {row['District']}<br>
+        <b>{selected_score} Delta:</b> {delta:.2f}
+        """
+
+        folium.GeoJson(
+            row.geometry,
+            style_function=lambda x, color=color: {
+                'color': color,
+                'weight': 4,
+                'opacity': 0.9
+            },
+            popup=folium.Popup(popup_text, max_width=300),
+            tooltip=f"Street ID: {row['Unique_ID']} | Delta: {delta:.2f}",
+            highlight_function=lambda x: {
+                'color': 'red',
+                'weight': 10,
+                'opacity': 0.5
+            }
+        ).add_to(m)
+
+    # Add Fullscreen control
+    Fullscreen(position="topleft").add_to(m)
+
+    # Display the map
+    folium_static(m, width=1300, height=600)
+
+# Jump to the radar chart of a listed street segment
+col6, col7 = st.columns([3, 1])
+
+with col6:
+    jump_street_id = st.selectbox("Select a Street ID to open its radar chart", top_streets['Unique_ID'].tolist())
+
+with col7:
+    st.markdown("<br>", unsafe_allow_html=True)
+    if st.button("Open Radar Chart") and jump_street_id:
+        # Widget keys of the Walkability Index page, they are cleared once the user leaves that page
+        st.session_state["walkability_street_id"] = jump_street_id
+        st.session_state["walkability_district"] = streets_gdf.loc[streets_gdf['Unique_ID'] == jump_street_id, 'District'].iloc[0]
+        st.switch_page("pages/1_Walkability Index.py")
+
+with st.expander("See explanation"):
+    st.write('''
+            The map shows the listed street segments, red for a decline and blue for an improvement
+            under Scenario-II. Select a Street ID and open its radar chart on the Walkability Index page.
+    ''')
+
+st.divider()
+
+# DELTA HISTOGRAM -------------------------------------
+counts, edges = histogram(district, selected_score)
+
+bin_centers = (edges[:-1] + edges[1:]) / 2
+
+fig_hist = go.Figure([go.Bar(
+    x=bin_centers,
+    y=counts,
+    width=edges[1:] - edges[:-1],
+    marker=dict(color=["#d13728" if center < 0 else "#436b88" for center in bin_centers]),
+    hovertemplate="Delta: %{x:.2f}<br>Streets: %{y}<extra></extra>"
+)])
+
+fig_hist.update_layout(
+    title=f"Distribution of {selected_score} Deltas in {selected_district}",
+    title_x=0,
+    title_xanchor='left',
+    xaxis_title="Scenario-II minus Scenario-I",
+    yaxis_title="Number of Street Segments",
+    height=450,
+)
+
+st.plotly_chart(fig_hist, use_container_width=True)
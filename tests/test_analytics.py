@@ -0,0 +1,84 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from analytics import compute_deltas, filter_district, top_k, delta_histogram
+
+
+@pytest.fixture
+def streets_df():
+    rng = np.random.default_rng(0)
+    n = 40
+    streets_df = pd.DataFrame({
+        "Unique_ID": np.arange(n),
+        "District": rng.choice(["Altstadt", "Mitte-Süd", "Münster-Nord"], n),
+        # Rounded scores give ties between segments
+        "Walkability Score - August": rng.integers(10, 60, n).astype(float),
+        "Walkability Score - October": rng.integers(10, 60, n).astype(float),
+        "Outdoor Thermal Comfort - August": rng.uniform(0, 100, n),
+        "Outdoor Thermal Comfort - October": rng.uniform(0, 100, n),
+    })
+    streets_df.loc[[3, 17, 29], "Walkability Score - October"] = np.nan
+    return streets_df
+
+
+def test_compute_deltas(streets_df):
+    deltas = compute_deltas(streets_df)
+
+    expected = streets_df["Walkability Score - October"] - streets_df["Walkability Score - August"]
+    pd.testing.assert_series_equal(deltas["Walkability Score"], expected, check_names=False)
+    assert deltas["Unique_ID"].tolist() == streets_df["Unique_ID"].astype(str).tolist()
+
+
+def test_filter_district(streets_df):
+    deltas = compute_deltas(streets_df)
+
+    assert filter_district(deltas) is deltas
+    assert set(filter_district(deltas, "Altstadt")["District"]) == {"Altstadt"}
+
+
+@pytest.mark.parametrize("column", ["Walkability Score", "Outdoor Thermal Comfort"])
+@pytest.mark.parametrize("worst", [True, False])
+@pytest.mark.parametrize("k", [0, 1, 5, 37, 40, 100])
+def test_top_k_matches_full_sort(streets_df, column, worst, k):
+    deltas = compute_deltas(streets_df)
+    expected = deltas.dropna(subset=[column]).sort_values(column, ascending=worst)[column].head(k)
+
+    ranked = top_k(deltas, column, k=k, worst=worst)
+
+    assert len(ranked) == min(k, deltas[column].notna().sum())
+    assert ranked[column].notna().all()
+    # Ties may come in any order, the ranked values must match
+    np.testing.assert_array_equal(ranked[column].to_numpy(), expected.to_numpy())
+
+
+def test_top_k_per_district(streets_df):
+    deltas = filter_district(compute_deltas(streets_df), "Mitte-Süd")
+
+    ranked = top_k(deltas, "Walkability Score", k=3)
+
+    assert set(ranked["District"]) == {"Mitte-Süd"}
+    assert ranked["Walkability Score"].tolist() == sorted(deltas["Walkability Score"].dropna())[:3]
+
+
+def test_delta_histogram(streets_df):
+    deltas = compute_deltas(streets_df)
+
+    counts, edges = delta_histogram(deltas, "Walkability Score", bins=10)
+
+    assert 0.0 in edges
+    assert counts.sum() == deltas["Walkability Score"].notna().sum()
+
+
+@pytest.mark.parametrize("values", [[-3.5, -1.2, 0.4, 7.9], [2.0, 3.0, 5.5], [-4.0, -0.5], [1.5, 1.5], [0.0]])
+def test_delta_histogram_splits_at_zero(values):
+    deltas = pd.DataFrame({"Walkability Score": values + [np.nan]})
+
+    counts, edges = delta_histogram(deltas, "Walkability Score", bins=5)
+
+    assert 0.0 in edges
+    assert counts.sum() == len(values)
+    # No bin holds both a decline and an improvement
+    for low, high in zip(edges[:-1], edges[1:]):
+        inside = [value for value in values if low <= value <= high]
+        assert not (any(value < 0 for value in inside) and any(value > 0 for value in inside))